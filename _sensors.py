@@ -0,0 +1,172 @@
+"""
+Minimal ctypes binding to libsensors, used to read a single temperature input
+without spawning the `sensors` command. Unlike reading hwmon sysfs directly,
+values returned here have the sensors.conf compute/offset rules applied.
+"""
+import ctypes
+import ctypes.util
+
+SENSORS_FEATURE_TEMP = 0x02
+SENSORS_SUBFEATURE_TEMP_INPUT = SENSORS_FEATURE_TEMP << 8
+
+class _BusId(ctypes.Structure):
+    _fields_ = [("type", ctypes.c_short), ("nr", ctypes.c_short)]
+
+class _ChipName(ctypes.Structure):
+    _fields_ = [
+        ("prefix", ctypes.c_char_p),
+        ("bus", _BusId),
+        ("addr", ctypes.c_int),
+        ("path", ctypes.c_char_p),
+    ]
+
+class _Feature(ctypes.Structure):
+    _fields_ = [
+        ("name", ctypes.c_char_p),
+        ("number", ctypes.c_int),
+        ("type", ctypes.c_int),
+        ("first_subfeature", ctypes.c_int),
+        ("padding1", ctypes.c_int),
+    ]
+
+class _Subfeature(ctypes.Structure):
+    _fields_ = [
+        ("name", ctypes.c_char_p),
+        ("number", ctypes.c_int),
+        ("type", ctypes.c_int),
+        ("mapping", ctypes.c_int),
+        ("flags", ctypes.c_uint),
+    ]
+
+_lib = None
+_libc = None
+_chip = None
+_subfeature_nr = None
+
+def _load_library():
+    """
+    Load libsensors and declare the prototypes used below.
+    Raises OSError if the library is not installed.
+    """
+    global _lib, _libc
+    lib = ctypes.CDLL(ctypes.util.find_library("sensors") or "libsensors.so.5")
+
+    lib.sensors_init.argtypes = [ctypes.c_void_p]
+    lib.sensors_init.restype = ctypes.c_int
+    lib.sensors_cleanup.argtypes = []
+    lib.sensors_cleanup.restype = None
+    lib.sensors_get_detected_chips.argtypes = [ctypes.POINTER(_ChipName), ctypes.POINTER(ctypes.c_int)]
+    lib.sensors_get_detected_chips.restype = ctypes.POINTER(_ChipName)
+    lib.sensors_get_features.argtypes = [ctypes.POINTER(_ChipName), ctypes.POINTER(ctypes.c_int)]
+    lib.sensors_get_features.restype = ctypes.POINTER(_Feature)
+    lib.sensors_get_subfeature.argtypes = [ctypes.POINTER(_ChipName), ctypes.POINTER(_Feature), ctypes.c_int]
+    lib.sensors_get_subfeature.restype = ctypes.POINTER(_Subfeature)
+    lib.sensors_get_label.argtypes = [ctypes.POINTER(_ChipName), ctypes.POINTER(_Feature)]
+    lib.sensors_get_label.restype = ctypes.c_void_p
+    lib.sensors_get_value.argtypes = [ctypes.POINTER(_ChipName), ctypes.c_int, ctypes.POINTER(ctypes.c_double)]
+    lib.sensors_get_value.restype = ctypes.c_int
+
+    libc = ctypes.CDLL(ctypes.util.find_library("c"))
+    libc.free.argtypes = [ctypes.c_void_p]
+    libc.free.restype = None
+
+    _lib, _libc = lib, libc
+
+def _get_label(chip, feature):
+    """
+    Return the label libsensors assigns to a feature, freeing the C string.
+    """
+    raw = _lib.sensors_get_label(chip, feature)
+    if not raw:
+        return None
+    try:
+        return ctypes.string_at(raw).decode(errors="replace")
+    finally:
+        _libc.free(raw)
+
+def _find_temp_input(chip, label):
+    """
+    Return the subfeature number of the chip's temperature input with the
+    given label, or None if it has none.
+    """
+    feature_nr = ctypes.c_int(0)
+    while True:
+        feature = _lib.sensors_get_features(chip, ctypes.byref(feature_nr))
+        if not feature:
+            return None
+        if feature.contents.type != SENSORS_FEATURE_TEMP or _get_label(chip, feature) != label:
+            continue
+        subfeature = _lib.sensors_get_subfeature(chip, feature, SENSORS_SUBFEATURE_TEMP_INPUT)
+        if subfeature:
+            return subfeature.contents.number
+
+def init(chip_prefix, label):
+    """
+    Initialize libsensors and cache the temperature input with the given
+    feature label, preferring the chip with the given prefix and falling back
+    to the first other chip that has such a label.
+    Returns True if the sensor was found, False otherwise.
+    """
+    global _chip, _subfeature_nr
+    if _subfeature_nr is not None:
+        return True
+
+    try:
+        if _lib is None:
+            _load_library()
+    except OSError:
+        return False
+
+    if _lib.sensors_init(None) != 0:
+        return False
+
+    fallback = None
+    chip_nr = ctypes.c_int(0)
+    while True:
+        chip = _lib.sensors_get_detected_chips(None, ctypes.byref(chip_nr))
+        if not chip:
+            break
+        preferred = chip.contents.prefix == chip_prefix.encode()
+        if not preferred and fallback is not None:
+            continue
+
+        subfeature_nr = _find_temp_input(chip, label)
+        if subfeature_nr is None:
+            continue
+        if preferred:
+            _chip, _subfeature_nr = chip, subfeature_nr
+            return True
+        fallback = (chip, subfeature_nr)
+
+    if fallback is not None:
+        _chip, _subfeature_nr = fallback
+        return True
+
+    _lib.sensors_cleanup()
+    return False
+
+def is_initialized():
+    """
+    Return True if init() has located a temperature input.
+    """
+    return _subfeature_nr is not None
+
+def read_temperature():
+    """
+    Read the cached temperature input.
+    Returns the temperature as a float, or None if the read failed.
+    """
+    value = ctypes.c_double()
+    if _lib.sensors_get_value(_chip, _subfeature_nr, ctypes.byref(value)) != 0:
+        return None
+    return value.value
+
+def cleanup():
+    """
+    Release libsensors state. init() must be called again before reading.
+    """
+    global _chip, _subfeature_nr
+    if _lib is not None and _subfeature_nr is not None:
+        _lib.sensors_cleanup()
+    _chip = None
+    _subfeature_nr = None
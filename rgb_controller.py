@@ -1,11 +1,23 @@
 import time
 import subprocess
 import os
+import glob
+import socket
+import signal
+from bisect import bisect_left
 import logging
-from datetime import datetime
+import argparse
+from concurrent.futures import ThreadPoolExecutor
 from openrgb import OpenRGBClient
 from openrgb.utils import RGBColor, DeviceType
 
+import _sensors
+
+try:
+    from liquidctl import find_liquidctl_devices
+except ImportError:
+    find_liquidctl_devices = None
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
@@ -16,29 +28,145 @@ logging.basicConfig(
 )
 logger = logging.getLogger("RGBController")
 
+OPENRGB_HOST = "127.0.0.1"
+OPENRGB_PORT = 6742
+# Delays between readiness probes while the OpenRGB server starts up.
+STARTUP_BACKOFF = (0.25, 0.5, 1, 2, 4, 4)
+
+DEFAULT_POLL_INTERVAL = 2.0
+# Upper bound for the base interval. Kept well below WatchdogSec=90 in
+# rgb-controller.service, since a tick only pings the watchdog once per poll.
+MAX_BASE_POLL_INTERVAL = 60.0
+
+def valid_poll_interval(value):
+    """
+    Return value as a float if it is a usable base polling interval.
+    Raises ValueError otherwise.
+    """
+    interval = float(value)
+    if not 0 < interval <= MAX_BASE_POLL_INTERVAL:
+        raise ValueError(f"poll interval must be in (0, {MAX_BASE_POLL_INTERVAL}] seconds, got {value}")
+    return interval
+
+def _poll_interval_from_env():
+    """
+    Read RGB_POLL_INTERVAL, falling back to DEFAULT_POLL_INTERVAL if it is
+    unset or invalid.
+    """
+    value = os.environ.get("RGB_POLL_INTERVAL")
+    if value is None:
+        return DEFAULT_POLL_INTERVAL
+    try:
+        return valid_poll_interval(value)
+    except ValueError as e:
+        logger.warning("Ignoring RGB_POLL_INTERVAL: %s", e)
+        return DEFAULT_POLL_INTERVAL
+
+POLL_INTERVAL = _poll_interval_from_env()
+# Once the color band has been stable for STABLE_TICKS polls, the interval
+# grows linearly up to MAX_POLL_INTERVAL until the band changes again.
+MAX_POLL_INTERVAL = 10.0
+STABLE_TICKS = 3
+
+# CPU the controller is pinned to and the niceness it runs at, so its
+# wakeups stay on one core and don't keep the others out of idle states.
+HOUSEKEEPING_CPU = 0
+NICENESS = 10
+
+# Seconds of suspend between two polls that count as a sleep/wake cycle.
+SLEEP_GAP_THRESHOLD = 1.0
+
+# Seconds between liveness probes of an idle OpenRGB connection.
+HEARTBEAT_INTERVAL = 30
+
+# Substring of the OpenRGB device name targeted by the "mouse" strategy.
+MOUSE_NAME = "G502"
+# liquidctl channel and mode used by the "cpu-liquidctl" strategy. Mode names
+# are driver specific: Asus Aura uses "static", Corsair/NZXT use "fixed".
+LIQUIDCTL_CHANNEL = "sync"
+LIQUIDCTL_MODE = "static"
+
+HWMON_ROOT = "/sys/class/hwmon"
+HWMON_CHIP = "k10temp"
+HWMON_LABEL = "Tctl"
+# Seconds to wait before searching for the temperature sensor again after
+# neither hwmon nor libsensors found it.
+SENSOR_RETRY_INTERVAL = 60
+
+# Upper bound (inclusive, in °C) of each color band; anything above the last
+# threshold uses the final color.
+_THRESHOLDS = (30, 40, 45, 50, 60, 65)
+_COLORS = (
+    (0, 0, 255),    # Blue
+    (63, 0, 192),   # Purple-blue
+    (0, 255, 0),    # Green
+    (127, 255, 0),  # Green-yellow
+    (255, 255, 0),  # Yellow
+    (255, 127, 0),  # Orange-red
+    (255, 0, 0),    # Red
+)
+# Degrees a reading must pass a band edge by before the band changes, so a
+# temperature hovering on a threshold doesn't flip colors every tick.
+HYSTERESIS = 1.5
+
+# id(device) -> index of its "Static" mode, or -1 if it has none. Device
+# modes don't change at runtime, so this is only rebuilt on reconnect.
+_STATIC_MODE_CACHE: dict[int, int] = {}
+# id(device) of devices already switched to Static mode since the last
+# reconnect or detected wake.
+_DEVICE_STATIC_SET: set[int] = set()
+# Set on a detected wake: the cached active_mode (ours and the server's) can't
+# be trusted then, so set_mode is sent even if it already reports Static.
+_FORCE_STATIC_MODE = False
+# Devices whose name contains MOUSE_NAME, looked up once per connection.
+_MOUSE_DEVICES = ()
+
+_SERVER_PROC = None
+# Scheduling settings from before reduce_scheduling_footprint, restored in
+# the OpenRGB server on restarts.
+_ORIGINAL_AFFINITY = None
+_ORIGINAL_NICENESS = None
+_LIQUIDCTL_DEVICE = None
+
+_TEMP_INPUT_PATH = None
+_TEMP_FD = None
+_SENSOR_RETRY_AT = 0.0
+
+def _server_listening():
+    """
+    Return True if the OpenRGB SDK port accepts TCP connections.
+    """
+    with socket.socket() as sock:
+        sock.settimeout(1)
+        return sock.connect_ex((OPENRGB_HOST, OPENRGB_PORT)) == 0
+
 def start_openrgb_server():
+    global _SERVER_PROC
     try:
-        subprocess.Popen(
+        _SERVER_PROC = subprocess.Popen(
             ["./openRGB.AppImage", "--server"],
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
+            preexec_fn=_restore_scheduling,
         )
         logger.info("Starting OpenRGB server...")
 
-        max_attempts = 10
-        for attempt in range(max_attempts):
-            try:
-                OpenRGBClient(address="127.0.0.1", port=6742)
-                logger.info(f"OpenRGB server started successfully after {attempt+1} attempts")
-                return True
-            except Exception:
-                logger.info(f"Waiting for server to start (attempt {attempt+1}/{max_attempts})...")
-                time.sleep(1)
+        max_attempts = len(STARTUP_BACKOFF)
+        for attempt, delay in enumerate(STARTUP_BACKOFF, 1):
+            if _server_listening():
+                try:
+                    OpenRGBClient(address=OPENRGB_HOST, port=OPENRGB_PORT).disconnect()
+                    logger.info("OpenRGB server started successfully after %s attempts", attempt)
+                    return True
+                except Exception:
+                    pass
+            logger.info("Waiting for server to start (attempt %s/%s)...", attempt, max_attempts)
+            time.sleep(delay)
         
         logger.error("Failed to connect to OpenRGB server after maximum attempts")
         return False
     except Exception as e:
-        logger.error(f"Failed to start OpenRGB server: {e}")
+        logger.error("Failed to start OpenRGB server: %s", e)
         return False
 
 def get_rgb_client():
@@ -49,76 +177,210 @@ def get_rgb_client():
     max_attempts = 10
     for attempt in range(max_attempts):
         try:
-            client = OpenRGBClient(address="127.0.0.1", port=6742)
+            client = OpenRGBClient(address=OPENRGB_HOST, port=OPENRGB_PORT)
             return client
         except Exception as e:
-            logger.warning(f"Connection attempt {attempt+1}/{max_attempts} failed: {e}")
+            logger.warning("Connection attempt %s/%s failed: %s", attempt+1, max_attempts, e)
             if attempt < max_attempts - 1:
                 logger.info("Retrying in 5 seconds...")
                 time.sleep(5)
     
     return None
 
-def detect_sleep_wake(last_timestamp):
+def suspended_time():
+    """
+    Return the total seconds the system has spent suspended since boot.
+    CLOCK_BOOTTIME keeps counting during suspend while CLOCK_MONOTONIC does
+    not, and neither is affected by wall-clock (NTP) adjustments.
+    """
+    return time.clock_gettime(time.CLOCK_BOOTTIME) - time.clock_gettime(time.CLOCK_MONOTONIC)
+
+def detect_sleep_wake(last_suspended):
     """
-    Detect if system has gone through sleep/wake cycle by checking time difference.
+    Detect if system has gone through sleep/wake cycle by checking whether the
+    suspended time grew since last_suspended was sampled.
     Returns True if a sleep/wake cycle is detected, False otherwise.
     """
-    current_time = datetime.now()
-    time_diff = (current_time - last_timestamp).total_seconds()
+    time_diff = suspended_time() - last_suspended
     
-    if time_diff > 30:
-        logger.info(f"Sleep/wake cycle detected. Time gap: {time_diff:.2f} seconds")
+    if time_diff > SLEEP_GAP_THRESHOLD:
+        logger.info("Sleep/wake cycle detected. Time suspended: %.2f seconds", time_diff)
         return True
     return False
 
 def restart_openrgb_server():
     """
-    Kill existing OpenRGB server process and start a new one.
+    Stop the OpenRGB server process started by start_openrgb_server and
+    start a new one.
     """
+    global _SERVER_PROC
     try:
-        subprocess.run(["pkill", "-f", "openRGB"], stderr=subprocess.DEVNULL)
-        logger.info("Killed existing OpenRGB processes")
-        time.sleep(1)
+        if _SERVER_PROC is not None:
+            if _SERVER_PROC.poll() is None:
+                _SERVER_PROC.terminate()
+                try:
+                    _SERVER_PROC.wait(timeout=2)
+                except subprocess.TimeoutExpired:
+                    _SERVER_PROC.kill()
+                    _SERVER_PROC.wait()
+            logger.info("Stopped OpenRGB server (pid %s)", _SERVER_PROC.pid)
+            _SERVER_PROC = None
         
         return start_openrgb_server()
     except Exception as e:
-        logger.error(f"Error restarting OpenRGB server: {e}")
+        logger.error("Error restarting OpenRGB server: %s", e)
         return False
 
+def _find_labelled_temp_input(hwmon_dir, label):
+    """
+    Return the tempN_input path under hwmon_dir whose label matches, or None.
+    """
+    for label_path in sorted(glob.glob(os.path.join(hwmon_dir, "temp*_label"))):
+        try:
+            with open(label_path) as f:
+                if f.read().strip() == label:
+                    return label_path[:-len("_label")] + "_input"
+        except OSError:
+            continue
+    return None
+
+def find_hwmon_temp_input(chip=HWMON_CHIP, label=HWMON_LABEL):
+    """
+    Locate the hwmon sysfs tempN_input file with the given label, preferring
+    the given chip name and falling back to any other chip exposing that
+    label (e.g. zenpower instead of k10temp).
+    Returns the path as a string, or None if no matching sensor is exposed.
+    """
+    fallback = None
+    for hwmon_dir in sorted(glob.glob(os.path.join(HWMON_ROOT, "hwmon*"))):
+        try:
+            with open(os.path.join(hwmon_dir, "name")) as f:
+                name = f.read().strip()
+        except OSError:
+            continue
+        if name != chip and fallback is not None:
+            continue
+
+        path = _find_labelled_temp_input(hwmon_dir, label)
+        if path is None:
+            continue
+        if name == chip:
+            return path
+        fallback = path
+    return fallback
+
+def _close_temperature_fd():
+    """
+    Close the cached hwmon file descriptor so the next read reopens it.
+    """
+    global _TEMP_FD
+    if _TEMP_FD is not None:
+        try:
+            os.close(_TEMP_FD)
+        except OSError:
+            pass
+        _TEMP_FD = None
+
 def get_cpu_temperature():
     """
-    Get the CPU temperature using the `sensors` command.
+    Get the CPU temperature by reading the hwmon sysfs input directly.
+    The file descriptor is opened once and reread with pread on every call.
+    Falls back to libsensors when the chip is not exposed under hwmon.
     Returns the temperature as a float, or None if unavailable.
     """
+    global _TEMP_INPUT_PATH, _TEMP_FD, _SENSOR_RETRY_AT
+    if _sensors.is_initialized():
+        temp = _sensors.read_temperature()
+        if temp is None:
+            logger.error("Error reading sensors through libsensors")
+            _sensors.cleanup()
+        return temp
+
+    if _TEMP_FD is None:
+        if _TEMP_INPUT_PATH is None:
+            if time.monotonic() < _SENSOR_RETRY_AT:
+                return None
+            _TEMP_INPUT_PATH = find_hwmon_temp_input(HWMON_CHIP, HWMON_LABEL)
+            if _TEMP_INPUT_PATH is None:
+                if _sensors.init(HWMON_CHIP, HWMON_LABEL):
+                    logger.info("Reading CPU temperature through libsensors")
+                    return get_cpu_temperature()
+                _SENSOR_RETRY_AT = time.monotonic() + SENSOR_RETRY_INTERVAL
+                logger.error("No %s temperature sensor found on %s or any other chip, retrying in %s seconds", HWMON_LABEL, HWMON_CHIP, SENSOR_RETRY_INTERVAL)
+                return None
+            logger.info("Reading CPU temperature from %s", _TEMP_INPUT_PATH)
+
+        try:
+            _TEMP_FD = os.open(_TEMP_INPUT_PATH, os.O_RDONLY)
+        except OSError as e:
+            logger.error("Error opening %s: %s", _TEMP_INPUT_PATH, e)
+            _TEMP_INPUT_PATH = None
+            return None
+
     try:
-        result = subprocess.run(["sensors"], capture_output=True, text=True, check=True)
-        for line in result.stdout.splitlines():
-            if "Tctl" in line:
-                temp = float(line.split()[1].replace("+", "").replace("°C", ""))
-                return temp
+        return int(os.pread(_TEMP_FD, 24, 0)) / 1000.0
     except Exception as e:
-        logger.error(f"Error reading sensors: {e}")
+        logger.error("Error reading sensors: %s", e)
+        _close_temperature_fd()
     return None
 
-def temperature_to_rgb(temp):
-    """
-    Map the input temperature to predefined color bands.
-    """
-    if temp <= 30:
-        return 0, 0, 255  # Blue
-    elif temp <= 40:
-        return 63, 0, 192  # Purple-blue
-    elif temp <= 45:
-        return 0, 255, 0  # Green
-    elif temp <= 50:
-        return 127, 255, 0  # Green-yellow
-    elif temp <= 60:
-        return 255, 255, 0  # Yellow
-    elif temp <= 65:
-        return 255, 127, 0  # Orange-red
-    else:
-        return 255, 0, 0  # Red
+def temperature_band(temp, prev_band=None):
+    """
+    Return the index of the color band for the input temperature.
+    When prev_band is given, stay in it until the temperature has moved
+    HYSTERESIS degrees past the edge of that band.
+    """
+    band = bisect_left(_THRESHOLDS, temp)
+    if prev_band is None or band == prev_band:
+        return band
+
+    if band > prev_band:
+        if temp - _THRESHOLDS[prev_band] < HYSTERESIS:
+            return prev_band
+    elif _THRESHOLDS[prev_band - 1] - temp < HYSTERESIS:
+        return prev_band
+    return band
+
+def _static_mode_index(device):
+    """
+    Return the index of the device's "Static" mode, or -1 if unavailable.
+    """
+    idx = _STATIC_MODE_CACHE.get(id(device))
+    if idx is None:
+        idx = next((i for i, mode in enumerate(device.modes) if mode.name == "Static"), -1)
+        _STATIC_MODE_CACHE[id(device)] = idx
+    return idx
+
+def poll_interval(stable_ticks):
+    """
+    Return the seconds to wait before the next poll, given how many
+    consecutive polls have stayed in the same color band.
+    """
+    if stable_ticks < STABLE_TICKS:
+        return POLL_INTERVAL
+    return min(max(MAX_POLL_INTERVAL, POLL_INTERVAL), POLL_INTERVAL * stable_ticks / STABLE_TICKS)
+
+def _set_device_color(device, rgb_color):
+    """
+    Set a single device's color, switching it to Static mode the first time
+    it is seen on this connection.
+    """
+    logger.debug("Targeting device: %s", device.name)
+    try:
+        if id(device) not in _DEVICE_STATIC_SET:
+            static_idx = _static_mode_index(device)
+            if static_idx < 0:
+                logger.warning("Static mode not available for %s. Available modes: %s", device.name, [mode.name for mode in device.modes])
+                return
+            if _FORCE_STATIC_MODE or device.active_mode != static_idx:
+                device.set_mode(device.modes[static_idx])
+            _DEVICE_STATIC_SET.add(id(device))
+
+        device.set_color(rgb_color, fast=True)
+        logger.debug("%s RGB set to R=%s, G=%s, B=%s", device.name, rgb_color.red, rgb_color.green, rgb_color.blue)
+
+    except Exception as e:
+        logger.error("Error applying color to %s: %s", device.name, e)
 
 def apply_rgb_color(client: OpenRGBClient, red, green, blue, prev_rgb, device_type=None):
     """
@@ -142,93 +404,385 @@ def apply_rgb_color(client: OpenRGBClient, red, green, blue, prev_rgb, device_ty
     if device_type is not None:
         target_devices = client.get_devices_by_type(device_type)
         if not target_devices:
-            logger.warning(f"No devices of type {device_type} found")
+            logger.warning("No devices of type %s found", device_type)
             return prev_rgb
 
     for device in target_devices:
-        logger.debug(f"Targeting device: {device.name}")
+        _set_device_color(device, rgb_color)
+    
+    return (red, green, blue)
+
+def apply_rgb_color_motherboard(client: OpenRGBClient, red, green, blue, prev_rgb):
+    """
+    Apply RGB color to motherboard devices only.
+    """
+    return apply_rgb_color(client, red, green, blue, prev_rgb, DeviceType.MOTHERBOARD)
+
+def index_devices(client: OpenRGBClient):
+    """
+    Look up the devices targeted by name once, right after connecting.
+    """
+    global _MOUSE_DEVICES
+    _MOUSE_DEVICES = tuple(device for device in client.devices if MOUSE_NAME in device.name)
+
+def apply_rgb_color_mouse(client: OpenRGBClient, red, green, blue, prev_rgb):
+    """
+    Apply RGB color to the devices whose name contains MOUSE_NAME.
+    """
+    if (red, green, blue) == prev_rgb:
+        return prev_rgb
+
+    if not _MOUSE_DEVICES:
+        logger.warning("No device matching %s found", MOUSE_NAME)
+        return prev_rgb
+
+    rgb_color = RGBColor(red, green, blue)
+    for device in _MOUSE_DEVICES:
+        _set_device_color(device, rgb_color)
+    return (red, green, blue)
+
+def get_liquidctl_device():
+    """
+    Return the connected liquidctl device, connecting to the first one found
+    on first use. Returns None if liquidctl or a device is unavailable.
+    """
+    global _LIQUIDCTL_DEVICE
+    if _LIQUIDCTL_DEVICE is None:
+        if find_liquidctl_devices is None:
+            logger.error("liquidctl is not installed")
+            return None
+        device = next(iter(find_liquidctl_devices()), None)
+        if device is None:
+            logger.error("No liquidctl device found")
+            return None
+        device.connect()
+        _LIQUIDCTL_DEVICE = device
+        logger.info("Using liquidctl device %s", device.description)
+    return _LIQUIDCTL_DEVICE
+
+def close_liquidctl_device():
+    """
+    Disconnect the cached liquidctl device, if any.
+    """
+    global _LIQUIDCTL_DEVICE
+    if _LIQUIDCTL_DEVICE is not None:
         try:
-            available_modes = [mode.name for mode in device.modes]
-            if "Static" in available_modes:
-                device.set_mode("Static")
-                device.set_color(rgb_color)
-                logger.debug(f"{device.name} RGB set to R={red}, G={green}, B={blue}")
-            else:
-                logger.warning(f"Static mode not available for {device.name}. Available modes: {available_modes}")
+            _LIQUIDCTL_DEVICE.disconnect()
+        except Exception:
+            pass
+        _LIQUIDCTL_DEVICE = None
+
+def apply_rgb_color_cpu(client: OpenRGBClient, red, green, blue, prev_rgb):
+    """
+    Apply RGB color to the CPU cooler through liquidctl.
+    The OpenRGB client is unused but kept for a uniform strategy signature.
+    """
+    if (red, green, blue) == prev_rgb:
+        return prev_rgb
+
+    try:
+        device = get_liquidctl_device()
+        if device is None:
+            return prev_rgb
+        device.set_color(LIQUIDCTL_CHANNEL, LIQUIDCTL_MODE, [(red, green, blue)])
+        logger.debug("liquidctl RGB set to R=%s, G=%s, B=%s", red, green, blue)
+    except Exception as e:
+        logger.error("Error applying color through liquidctl: %s", e)
+        close_liquidctl_device()
+        return prev_rgb
 
-        except Exception as e:
-            logger.error(f"Error applying color to {device.name}: {e}")
-    
     return (red, green, blue)
 
+STRATEGIES = {
+    "all": apply_rgb_color,
+    "motherboard": apply_rgb_color_motherboard,
+    "mouse": apply_rgb_color_mouse,
+    "cpu-liquidctl": apply_rgb_color_cpu,
+}
+
 def print_device_info(client):
     """
     Print information about all detected devices.
     """
     logger.info("\nDetected devices:")
     for device in client.devices:
-        logger.info(f"Device: {device.name} (Type: {device.type})")
-        logger.info(f"  Available modes: {[mode.name for mode in device.modes]}")
-        logger.info(f"  Zones: {len(device.zones)}")
-        logger.info(f"  LEDs: {len(device.leds)}")
+        logger.info("Device: %s (Type: %s)", device.name, device.type)
+        logger.info("  Available modes: %s", [mode.name for mode in device.modes])
+        logger.info("  Zones: %s", len(device.zones))
+        logger.info("  LEDs: %s", len(device.leds))
         logger.info("")
 
+class RGBConnection:
+    """
+    Long-lived OpenRGB client that is kept open across ticks and only rebuilt
+    when it is actually found to be broken.
+    """
+
+    def __init__(self):
+        self.client = None
+        self._last_heartbeat = 0.0
+
+    def connect(self):
+        """
+        Open a new client, retrying while the server comes up.
+        Returns the client, or None if the connection failed.
+        """
+        global _FORCE_STATIC_MODE
+        self.client = get_rgb_client()
+        if self.client is not None:
+            print_device_info(self.client)
+            _STATIC_MODE_CACHE.clear()
+            _DEVICE_STATIC_SET.clear()
+            _FORCE_STATIC_MODE = False
+            index_devices(self.client)
+            self._last_heartbeat = time.monotonic()
+        return self.client
+
+    def reset(self):
+        """
+        Drop the current client so the next ensure_alive() reconnects.
+        """
+        if self.client is not None:
+            try:
+                self.client.disconnect()
+            except Exception:
+                pass
+        self.client = None
+
+    def ensure_alive(self, force=False):
+        """
+        Return a working client. An open client is probed with a cheap
+        request at most every HEARTBEAT_INTERVAL seconds (or now if force
+        is set); only if that fails is the server restarted and reconnected.
+        Returns None if no connection could be made.
+        """
+        if self.client is None:
+            return self.connect()
+
+        now = time.monotonic()
+        if not force and now - self._last_heartbeat < HEARTBEAT_INTERVAL:
+            return self.client
+
+        try:
+            self.client.update_profiles()
+            self._last_heartbeat = now
+            return self.client
+        except Exception as e:
+            logger.warning("OpenRGB heartbeat failed: %s", e)
+
+        self.reset()
+        restart_openrgb_server()
+        return self.connect()
+
+def sd_notify(state):
+    """
+    Send a state update (e.g. "READY=1", "WATCHDOG=1") to systemd.
+    Does nothing unless running as a Type=notify service.
+    """
+    address = os.environ.get("NOTIFY_SOCKET")
+    if not address:
+        return
+    if address.startswith("@"):
+        address = "\0" + address[1:]
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sock:
+            sock.connect(address)
+            sock.sendall(state.encode())
+    except OSError as e:
+        logger.warning("Failed to notify systemd: %s", e)
+
+def reduce_scheduling_footprint(cpu=HOUSEKEEPING_CPU, niceness=NICENESS):
+    """
+    Pin this process to a single CPU and lower its scheduling priority.
+    The previous settings are kept so _restore_scheduling can undo this in
+    the OpenRGB server when it is restarted.
+    """
+    global _ORIGINAL_AFFINITY, _ORIGINAL_NICENESS
+    try:
+        affinity = os.sched_getaffinity(0)
+        os.sched_setaffinity(0, {cpu})
+        _ORIGINAL_AFFINITY = affinity
+    except (AttributeError, OSError) as e:
+        logger.warning("Could not pin controller to CPU %s: %s", cpu, e)
+    try:
+        current = os.getpriority(os.PRIO_PROCESS, 0)
+        os.nice(niceness)
+        _ORIGINAL_NICENESS = current
+    except OSError as e:
+        logger.warning("Could not lower controller priority: %s", e)
+
+def _restore_scheduling():
+    """
+    Undo reduce_scheduling_footprint in a child process before it execs.
+    Lowering the niceness again needs CAP_SYS_NICE or a permissive
+    RLIMIT_NICE; without them the child keeps the controller's niceness.
+    """
+    if _ORIGINAL_AFFINITY is not None:
+        try:
+            os.sched_setaffinity(0, _ORIGINAL_AFFINITY)
+        except OSError:
+            pass
+    if _ORIGINAL_NICENESS is not None:
+        try:
+            os.setpriority(os.PRIO_PROCESS, 0, _ORIGINAL_NICENESS)
+        except OSError:
+            pass
+
+def _handle_sigterm(signum, frame):
+    """
+    Turn SIGTERM (e.g. systemctl stop) into the same clean exit as Ctrl+C.
+    """
+    raise KeyboardInterrupt
+
+def _interval_arg(value):
+    """
+    argparse type for --interval that reports invalid values as usage errors.
+    """
+    try:
+        return valid_poll_interval(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+def parse_args():
+    """
+    Parse the command line options.
+    """
+    parser = argparse.ArgumentParser(description="Set RGB lighting from the CPU temperature.")
+    parser.add_argument(
+        "--targets",
+        choices=STRATEGIES,
+        default="all",
+        help="Which devices to color (default: all)",
+    )
+    parser.add_argument(
+        "--chip",
+        default=HWMON_CHIP,
+        help=f"Preferred hwmon/libsensors chip for the {HWMON_LABEL} temperature (default: {HWMON_CHIP})",
+    )
+    parser.add_argument(
+        "--liquidctl-mode",
+        default=LIQUIDCTL_MODE,
+        help=f"liquidctl color mode for --targets cpu-liquidctl (default: {LIQUIDCTL_MODE})",
+    )
+    parser.add_argument(
+        "--interval",
+        type=_interval_arg,
+        default=POLL_INTERVAL,
+        help=f"Base polling interval in seconds, at most {MAX_BASE_POLL_INTERVAL} (default: {POLL_INTERVAL}, or RGB_POLL_INTERVAL)",
+    )
+    return parser.parse_args()
+
 if __name__ == "__main__":
-    logger.info("RGB Controller starting up...")
+    args = parse_args()
+    POLL_INTERVAL = args.interval
+    HWMON_CHIP = args.chip
+    LIQUIDCTL_MODE = args.liquidctl_mode
+    apply_strategy = STRATEGIES[args.targets]
+    signal.signal(signal.SIGTERM, _handle_sigterm)
+
+    logger.info("RGB Controller starting up (targets: %s)...", args.targets)
     prev_rgb = (-1, -1, -1)
-    last_check_time = datetime.now()
+    prev_band = None
+    stable_ticks = 0
+    last_suspended = suspended_time()
     
     if not start_openrgb_server():
         logger.error("Failed to start OpenRGB server. Exiting.")
         exit(1)
     
+    # Only after the server is spawned, so it isn't pinned or reniced too.
+    reduce_scheduling_footprint()
+    sd_notify("READY=1")
+    conn = RGBConnection()
     client = None
+    # Color writes run on a single worker thread so the next temperature read
+    # overlaps the previous tick's OpenRGB round trips. pending_write holds
+    # (future, band) until the result is collected on the following tick.
+    writer = ThreadPoolExecutor(max_workers=1)
+    pending_write = None
     
-    while True:
-        try:
-            current_time = datetime.now()
+    try:
+        while True:
+            try:
+                tick_start = time.monotonic()
+                current_suspended = suspended_time()
+            
+                try:
+                    cpu_temp = get_cpu_temperature()
+                except Exception as e:
+                    logger.error("Error in temperature processing: %s", e)
+                    cpu_temp = None
             
-            if detect_sleep_wake(last_check_time):
-                logger.info("System appears to have woken from sleep. Reinitializing...")
-                client = None
-                restart_openrgb_server()
+                if pending_write is not None:
+                    future, band = pending_write
+                    pending_write = None
+                    try:
+                        prev_rgb = future.result()
+                        # Strategies return the old color when nothing was written;
+                        # keep the old band then so the next tick retries.
+                        if prev_rgb == _COLORS[band]:
+                            prev_band = band
+                    except Exception as e:
+                        logger.error("Error applying RGB color: %s", e)
+                        conn.reset()
+                        continue
             
-            last_check_time = current_time
+                woke = detect_sleep_wake(last_suspended)
+                if woke:
+                    logger.info("System appears to have woken from sleep. Checking OpenRGB connection...")
+                    # Devices often come back from suspend in their firmware default
+                    # mode, so re-apply the current color even if the client survived.
+                    prev_rgb = (-1, -1, -1)
+                    prev_band = None
+                    stable_ticks = 0
+                    _DEVICE_STATIC_SET.clear()
+                    _FORCE_STATIC_MODE = True
             
-            if client is None:
-                client = get_rgb_client()
-                if client is None:
+                last_suspended = current_suspended
+            
+                connected = conn.ensure_alive(force=woke)
+                if connected is None:
                     logger.warning("Failed to connect to OpenRGB server. Retrying in 5 seconds...")
                     time.sleep(5)
                     continue
-                
-                print_device_info(client)
             
+                if connected is not client:
+                    client = connected
+                    prev_rgb = (-1, -1, -1)
+                    prev_band = None
+                    stable_ticks = 0
             
-            try:
-                cpu_temp = get_cpu_temperature()
-                if cpu_temp is not None:
-                    logger.info(f"CPU Temperature: {cpu_temp}°C")
-                    red, green, blue = temperature_to_rgb(cpu_temp)
-                    
-                    try:
-                        prev_rgb = apply_rgb_color(client, red, green, blue, prev_rgb)
-                    except Exception as e:
-                        logger.error(f"Error applying RGB color: {e}")
-                        client = None
-                        continue
-                else:
-                    logger.warning("Unable to read CPU temperature.")
-            except Exception as e:
-                logger.error(f"Error in temperature processing: {e}")
             
-            time.sleep(2)
+                try:
+                    if cpu_temp is not None:
+                        logger.info("CPU Temperature: %s°C", cpu_temp)
+                        band = temperature_band(cpu_temp, prev_band)
+
+                        if band == prev_band:
+                            stable_ticks += 1
+                        else:
+                            stable_ticks = 0
+                            red, green, blue = _COLORS[band]
+                            pending_write = (writer.submit(apply_strategy, client, red, green, blue, prev_rgb), band)
+                    else:
+                        logger.warning("Unable to read CPU temperature.")
+                except Exception as e:
+                    logger.error("Error in temperature processing: %s", e)
             
-        except KeyboardInterrupt:
-            logger.info("\nExiting RGB controller...")
-            break
-        except Exception as e:
-            logger.error(f"Fatal error in main loop: {e}")
-            logger.info("Resetting connection and retrying in 5 seconds...")
-            client = None
-            time.sleep(5)
+                sd_notify("WATCHDOG=1")
+                time.sleep(max(0, tick_start + poll_interval(stable_ticks) - time.monotonic()))
+            
+            except Exception as e:
+                logger.error("Fatal error in main loop: %s", e)
+                logger.info("Resetting connection and retrying in 5 seconds...")
+                if pending_write is not None:
+                    pending_write[0].exception()
+                    pending_write = None
+                conn.reset()
+                time.sleep(5)
+    except KeyboardInterrupt:
+        logger.info("\nExiting RGB controller...")
+    finally:
+        sd_notify("STOPPING=1")
+        writer.shutdown(wait=True)
+        close_liquidctl_device()